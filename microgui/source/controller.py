@@ -7,17 +7,22 @@ about change.
 
 
 from configuration import load_config, save_config, save_pos_config
-from epics import ca, caput, PV
+from epics import caget_many, dbr, PV
 from gui import GUI
 from functools import partial
+from PyQt5.QtCore import pyqtSignal, QObject, QSignalBlocker, QTimer
 from PyQt5.QtGui import QColor
-from PyQt5.QtWidgets import QFileDialog, QLineEdit
+from PyQt5.QtWidgets import QFileDialog, QLabel, QLineEdit
 from thorlabs_apt import Motor
 from thorlabs_motor_control import changeMode, disable, enable, home
-from typing import Any, Dict, Literal
+from typing import Any, Callable, Dict, Literal
+import time
 
-# Set up epics environment.
-ca.find_libca()
+
+class _Bridge(QObject):
+    """Signal queued process variable updates to the GUI thread."""
+
+    updateQueued = pyqtSignal()
 
 
 class Controller(object):
@@ -35,51 +40,40 @@ class Controller(object):
 
     Attributes
     ----------
+    MODES : tuple
+        Macro identifiers of the microscope mode positions.
+    PV_SUFFIXES : tuple
+        Macro name suffixes of the process variables configured per motor.
+    COMMAND_SUFFIXES : tuple
+        Macro name suffixes of the process variables that are only written to
+        or read on demand and hence not monitored.
+    STATUS : dict
+        Motor status label text and background colour for each motor state
+        value.
+    STATUS_STYLE : str
+        Style sheet of the motor status labels keyed on their "motorState"
+        property.
+    LIMIT_STYLE : str
+        Style sheet of the limit indicators keyed on their "limitState"
+        property.
+    CONTINUOUS_DEBOUNCE : float
+        Time in seconds within which a repeated continuous motion command is
+        ignored.
+    STEPS_TEXT, MICRONS_TEXT : str
+        Current position label templates in units of steps and microns.
     gui : GUI
         User interface to control.
     modeMotor : Motor
         THORLABS motor unit controlling the microscope mode.
-    PV_SSTEP, PV_YSSTEP, PV_ZSSTEP : PV
-        Step PV's for the sample's x, y, and z dimensions.
-    PV_XOSTEP, PV_YOSTEP, PV_ZOSTEP : PV
-        Step PV's for the objective's x, y, and z dimensions.
-    PV_XSABSPOS, PV_YSABSPOS, PV_ZSABSPOS : PV
-        Absolute position PV's for the sample's x, y, and z dimensions.
-    PV_XOABSPOS, PV_YOABSPOS, PV_ZOABSPOS : PV
-        Absolute position PV's for the objective's x, y, and z dimensions.
-    PV_XSPOS, PV_YSPOS, PV_ZSPOS : PV
-        Current position PV's for the sample's x, y, and z dimensions.
-    PV_XOPOS, PV_YOPOS, PV_ZOPOS : PV
-        Current position PV's for the objective's x, y, and z dimensions.
-    PV_XSPOS_ABS, PV_YSPOS_ABS, PV_ZSPOS_ABS : PV
-        Absolute current position PV's for the sample's x, y, and z dimensions.
-    PV_XOPOS_ABS, PV_YOPOS_ABS, PV_ZOPOS_ABS : PV
-        Absolute current position PV's for the objective's x, y, and z
-        dimensions.
-    PV_XSMOVE, PV_YSMOVE, PV_ZSMOVE : PV
-        Move PV's of the sample's x, y, and z dimensions.
-    PV_XOMOVE, PV_YOMOVE, PV_ZOMOVE : PV
-        Move PV's of the objective's x, y, and z dimensions.
-    PV_XSSTOP, PV_YSSTOP, PV_ZSSTOP : PV
-        Stop PV's for the sample's x, y, and z dimensions.
-    PV_XOSTOP, PV_YOSTOP, PV_ZOSTOP : PV
-        Stop PV's for the objective's x, y, and z dimensions.
-    PV_XSHN, PV_YSHN, PV_ZSHN : PV
-        Negative hard limit PV's for the sample's x, y, and z dimensions.
-    PV_XSHP, PV_YSHP, PV_ZSHP : PV
-        Positive hard limit PV's for the sample's x, y, and z dimensions.
-    PV_XOHN, PV_YOHN, PV_ZOHN: PV
-        Negative hard limit PV's for the objective's x, y, and z dimensions.
-    PV_XOHP, PV_YOHP, PV_ZOHP : PV
-        Positive hard limit PV's for the objective's x, y, and z dimensions.
-    PV_XSSTATE, PV_YSSTATE, PV_ZSSTATE : PV
-        State PV's of the sample's x, y, and z dimensions.
-    PV_XOSTATE, PV_YOSTATE, PV_ZOSTATE : PV
-        State PV's of the objective's x, y, and z dimensions.
-    PV_XSOFFSET, PV_YSOFFSET, PV_ZSOFFSET : PV
-        Offset PV's for the sample's x, y, and z dimensions.
-    PV_XOOFFSET, PV_YOOFFSET, PV_ZOOFFSET : PV
-        Offset PV's for the objective's x, y, and z dimensions.
+    pvs : dict
+        Process variables of each motor keyed by `(object, axis, suffix)`,
+        where `suffix` is the macro name suffix (e.g. `("S", "X", "STEP")` for
+        the "XSSTEP" macro). The suffixes are those listed in `PV_SUFFIXES`.
+    positionTimer : QTimer
+        Timer driving the polling of the current position PV's.
+    updateTimer : QTimer
+        Single shot timer driving the application of queued PV monitor
+        updates.
 
     Methods
     -------
@@ -101,12 +95,20 @@ class Controller(object):
         Increment motor position
     absolute(object, axis, pos)
         Move motor to an absolute position.
+    move(object, axis, absPos)
+        Start a move to an absolute position.
     continuous(object, axis, type)
         Control continuous motion of the motor.
     update_soft_lim(buttonID)
         Update sample and objective soft limits.
     update_backlash()
         Update backlash variables.
+    queue_update(handler, **kwargs)
+        Queue a process variable update for the user interface.
+    schedule_updates()
+        Schedule the application of queued process variable updates.
+    apply_updates()
+        Apply queued process variable updates.
     motor_status(**kwargs)
         Set motor status indicators.
     check_motor_position()
@@ -115,6 +117,8 @@ class Controller(object):
         Set soft limit indicators.
     hard_lim_indicators(**kwargs)
         Set hard limit indicators.
+    set_limit_indicator(label, active)
+        Set a limit indicator.
     change_display_vals()
         Toggle display values between actual and relative.
     change_to_actual()
@@ -125,8 +129,14 @@ class Controller(object):
         Zero motor position.
     actual(object, axis)
         Un-zero motor position.
-    set_current_position(**kwargs)
+    poll_positions()
+        Poll the current position process variables.
+    set_current_position(object, axis, value)
         Update current position label.
+    position_text(object, axis, value)
+        Format a current position label.
+    valid_input(*lineEdits)
+        Check numeric line edits hold acceptable input.
     append_text(text, color)
         Append text to console window.
     load_config()
@@ -145,6 +155,40 @@ class Controller(object):
         Clear all saved positions.
     """
 
+    MODES = ("TRANSMISSION_POSITION", "REFLECTION_POSITION",
+             "VISIBLE_IMAGE_POSITION", "BEAMSPLITTER_POSITION")
+
+    PV_SUFFIXES = ("STEP", "ABSPOS", "POS", "POS_ABS", "MOVE", "N", "P",
+                   "CN", "CP", "STOP", "HN", "HP", "STATE", "OFFSET", "ZERO",
+                   "B")
+
+    COMMAND_SUFFIXES = ("STEP", "ABSPOS", "MOVE", "N", "P", "CN", "CP", "STOP",
+                        "ZERO", "B")
+
+    STATUS = {
+        0: ("IDLE", "lightgrey"),
+        1: ("POWERING", "#ff4747"),
+        2: ("POWERED", "#ff4747"),
+        3: ("RELEASING", "#edde07"),
+        4: ("ACTIVE", "#3ac200"),
+        5: ("APPLYING", "#edde07"),
+        6: ("UNPOWERING", "#ff4747")
+    }
+
+    STATUS_STYLE = "QLabel { border: 1px solid black; }" + "".join(
+        f"QLabel[motorState=\"{text}\"] {{ background-color: {color}; }}"
+        for text, color in STATUS.values())
+
+    LIMIT_STYLE = (
+        "QLabel { background-color: lightgrey; border: 1px solid black; }"
+        "QLabel[limitState=\"on\"] { background-color: #3ac200; }"
+    )
+
+    CONTINUOUS_DEBOUNCE = 0.2
+
+    STEPS_TEXT = "<b>%.1f STEPS</b>"
+    MICRONS_TEXT = "<b>%.1f MICRONS</b>"
+
     def __init__(self, gui: GUI, modeMotor: Motor) -> None:
         """Initialize the Controller.
 
@@ -158,10 +202,77 @@ class Controller(object):
         self.gui = gui
         self.modeMotor = modeMotor
 
+        # Last polled current position of each motor stage.
+        self._positions = {}
+
+        # Latest monitor update of each PV waiting to be applied.
+        self._pendingUpdates = {}
+
+        # Last continuous motion command and its time for each motor.
+        self._lastContinuous = {}
+
+        # Position line edit and radio button of each mode.
+        tab = self.gui.tab
+        self._modeWidgets = dict(zip(self.MODES, [
+            (tab.TMTM, tab.RDM1), (tab.TMRM, tab.RDM2),
+            (tab.TMVM, tab.RDM3), (tab.TMBM, tab.RDM4)
+        ]))
+
+        # Status, current position and limit indicator labels as well as step
+        # and absolute position line edits of each motor.
+        guiDict = self.__dict__["gui"].__dict__
+        self._stepEdits = {}
+        self._absPosEdits = {}
+        self._statusLabels = {}
+        self._stepLabels = {}
+        self._softLimLabels = {}
+        self._hardLimLabels = {}
+        for object in ["S", "O"]:
+            for axis in ["X", "Y", "Z"]:
+                prefix = f"{axis.lower()}{object}"
+                self._statusLabels[(object, axis)] = \
+                    guiDict[f"{axis.lower()}Idle{object}"]
+                self._stepLabels[(object, axis)] = \
+                    guiDict[f"{axis.lower()}Step{object}"]
+                self._softLimLabels[(object, axis)] = (
+                    guiDict[f"{prefix}Sn"], guiDict[f"{prefix}Sp"])
+                for suffix in ["HN", "HP"]:
+                    self._hardLimLabels[(object, axis, suffix)] = \
+                        guiDict[f"{prefix}{suffix.capitalize()}"]
+                self._stepEdits[(object, axis)] = guiDict[f"{prefix}Step"]
+                self._absPosEdits[(object, axis)] = guiDict[f"{prefix}AbsPos"]
+
+        # Style the status labels once, toggling only their property later.
+        for label in self._statusLabels.values():
+            label.setProperty("motorState", "IDLE")
+            label.setStyleSheet(self.STATUS_STYLE)
+
+        # Style the limit indicators once, toggling only their property later.
+        limLabels = list(self._hardLimLabels.values())
+        for negLim, posLim in self._softLimLabels.values():
+            limLabels += [negLim, posLim]
+        for label in limLabels:
+            label.setProperty("limitState", "off")
+            label.setStyleSheet(self.LIMIT_STYLE)
+
+        # Apply queued monitor updates at most ~30 times per second, only
+        # waking the GUI thread when an update has been queued.
+        self.updateTimer = QTimer(self.gui)
+        self.updateTimer.setSingleShot(True)
+        self.updateTimer.setInterval(33)
+        self.updateTimer.timeout.connect(self.apply_updates)
+        self._bridge = _Bridge()
+        self._bridge.updateQueued.connect(self.schedule_updates)
+
         self.initialize_process_variables()
         self.initialize_gui()
         self.connect_signals()
 
+        # Poll the current positions at a fixed rate.
+        self.positionTimer = QTimer(self.gui)
+        self.positionTimer.timeout.connect(self.poll_positions)
+        self.positionTimer.start(250)
+
     def initialize_process_variables(self) -> None:
         """Conigure user interface process variables.
 
@@ -179,107 +290,43 @@ class Controller(object):
 
         mac = self.gui.macros
 
-        # Conigure step PV.
-        self.PV_XSSTEP = PV(pvname=mac["XSSTEP"])
-        self.PV_YSSTEP = PV(pvname=mac["YSSTEP"])
-        self.PV_ZSSTEP = PV(pvname=mac["ZSSTEP"])
-        self.PV_XOSTEP = PV(pvname=mac["XOSTEP"])
-        self.PV_YOSTEP = PV(pvname=mac["YOSTEP"])
-        self.PV_ZOSTEP = PV(pvname=mac["XOSTEP"])
-
-        # Set absolute position PV monitoring and callback.
-        self.PV_XSABSPOS = PV(pvname=mac["XSABSPOS"])
-        self.PV_YSABSPOS = PV(pvname=mac["YSABSPOS"])
-        self.PV_ZSABSPOS = PV(pvname=mac["ZSABSPOS"])
-        self.PV_XOABSPOS = PV(pvname=mac["XOABSPOS"])
-        self.PV_YOABSPOS = PV(pvname=mac["YOABSPOS"])
-        self.PV_ZOABSPOS = PV(pvname=mac["ZOABSPOS"])
-
-        # Set current position PV monitoring and callback.
-        cb = self.set_current_position
-        self.PV_XSPOS = PV(pvname=mac["XSPOS"], auto_monitor=True, callback=cb)
-        self.PV_YSPOS = PV(pvname=mac["YSPOS"], auto_monitor=True, callback=cb)
-        self.PV_ZSPOS = PV(pvname=mac["ZSPOS"], auto_monitor=True, callback=cb)
-        self.PV_XOPOS = PV(pvname=mac["XOPOS"], auto_monitor=True, callback=cb)
-        self.PV_YOPOS = PV(pvname=mac["YOPOS"], auto_monitor=True, callback=cb)
-        self.PV_ZOPOS = PV(pvname=mac["ZOPOS"], auto_monitor=True, callback=cb)
-
-        # Initialize current absolute position PV's.
-        self.PV_XSPOS_ABS = PV(pvname=mac["XSPOS_ABS"])
-        self.PV_YSPOS_ABS = PV(pvname=mac["YSPOS_ABS"])
-        self.PV_ZSPOS_ABS = PV(pvname=mac["ZSPOS_ABS"])
-        self.PV_XOPOS_ABS = PV(pvname=mac["XOPOS_ABS"])
-        self.PV_YOPOS_ABS = PV(pvname=mac["YOPOS_ABS"])
-        self.PV_ZOPOS_ABS = PV(pvname=mac["ZOPOS_ABS"])
-
-        # Initialize move PV's.
-        self.PV_XSMOVE = PV(pvname=mac["XSMOVE"])
-        self.PV_YSMOVE = PV(pvname=mac["YSMOVE"])
-        self.PV_ZSMOVE = PV(pvname=mac["ZSMOVE"])
-        self.PV_XOMOVE = PV(pvname=mac["XOMOVE"])
-        self.PV_YOMOVE = PV(pvname=mac["YOMOVE"])
-        self.PV_ZOMOVE = PV(pvname=mac["ZOMOVE"])
-
-        # Configure emergency stop PVs.
-        self.PV_XSSTOP = PV(pvname=mac["XSSTOP"])
-        self.PV_YSSTOP = PV(pvname=mac["YSSTOP"])
-        self.PV_ZSSTOP = PV(pvname=mac["ZSSTOP"])
-        self.PV_XOSTOP = PV(pvname=mac["XOSTOP"])
-        self.PV_YOSTOP = PV(pvname=mac["YOSTOP"])
-        self.PV_ZOSTOP = PV(pvname=mac["ZOSTOP"])
-
-        # Set hard limit position PV monitoring and callback.
-        cb = self.hard_lim_indicators
-        self.PV_XSHN = PV(pvname=mac["XSHN"], auto_monitor=True, callback=cb)
-        self.PV_XSHP = PV(pvname=mac["XSHP"], auto_monitor=True, callback=cb)
-        self.PV_YSHN = PV(pvname=mac["YSHN"], auto_monitor=True, callback=cb)
-        self.PV_YSHP = PV(pvname=mac["YSHP"], auto_monitor=True, callback=cb)
-        self.PV_ZSHN = PV(pvname=mac["ZSHN"], auto_monitor=True, callback=cb)
-        self.PV_ZSHP = PV(pvname=mac["ZSHP"], auto_monitor=True, callback=cb)
-        self.PV_XOHN = PV(pvname=mac["XOHN"], auto_monitor=True, callback=cb)
-        self.PV_XOHP = PV(pvname=mac["XOHP"], auto_monitor=True, callback=cb)
-        self.PV_YOHN = PV(pvname=mac["YOHN"], auto_monitor=True, callback=cb)
-        self.PV_YOHP = PV(pvname=mac["YOHP"], auto_monitor=True, callback=cb)
-        self.PV_ZOHN = PV(pvname=mac["ZOHN"], auto_monitor=True, callback=cb)
-        self.PV_ZOHP = PV(pvname=mac["ZOHP"], auto_monitor=True, callback=cb)
-
-        # Set state PV monitoring and callback.
-        cb = self.motor_status
-        self.PV_XSSTATE = PV(pvname=mac["XSSTATE"], auto_monitor=True,
-                             callback=cb)
-        self.PV_YSSTATE = PV(pvname=mac["YSSTATE"], auto_monitor=True,
-                             callback=cb)
-        self.PV_ZSSTATE = PV(pvname=mac["ZSSTATE"], auto_monitor=True,
-                             callback=cb)
-        self.PV_XOSTATE = PV(pvname=mac["XOSTATE"], auto_monitor=True,
-                             callback=cb)
-        self.PV_YOSTATE = PV(pvname=mac["YOSTATE"], auto_monitor=True,
-                             callback=cb)
-        self.PV_ZOSTATE = PV(pvname=mac["ZOSTATE"], auto_monitor=True,
-                             callback=cb)
-
-        # Initialize offset PV monitoring and callback.
-        cb = self.change_display_vals
-        self.PV_XSOFFSET = PV(pvname=mac["XSOFFSET"], auto_monitor=True,
-                              callback=cb)
-        self.PV_YSOFFSET = PV(pvname=mac["YSOFFSET"], auto_monitor=True,
-                              callback=cb)
-        self.PV_ZSOFFSET = PV(pvname=mac["ZSOFFSET"], auto_monitor=True,
-                              callback=cb)
-        self.PV_XOOFFSET = PV(pvname=mac["XOOFFSET"], auto_monitor=True,
-                              callback=cb)
-        self.PV_YOOFFSET = PV(pvname=mac["YOOFFSET"], auto_monitor=True,
-                              callback=cb)
-        self.PV_ZOOFFSET = PV(pvname=mac["ZOOFFSET"], auto_monitor=True,
-                              callback=cb)
-
-        # Intialize backlash PV's.
-        self.PV_XSB = PV(mac["XSB"])
-        self.PV_YSB = PV(mac["YSB"])
-        self.PV_ZSB = PV(mac["ZSB"])
-        self.PV_XOB = PV(mac["XOB"])
-        self.PV_YOB = PV(mac["YOB"])
-        self.PV_ZOB = PV(mac["ZOB"])
+        # Monitored PV's and the methods handling their updates.
+        callbacks = {"HN": self.hard_lim_indicators,
+                     "HP": self.hard_lim_indicators,
+                     "STATE": self.motor_status,
+                     "OFFSET": self.change_display_vals}
+
+        self.pvs = {}
+        self._pvKeys = {}
+        for object in ["S", "O"]:
+            for axis in ["X", "Y", "Z"]:
+                for suffix in self.PV_SUFFIXES:
+
+                    pvname = mac[f"{axis}{object}{suffix}"]
+
+                    if suffix == "POS" or suffix in self.COMMAND_SUFFIXES:
+                        # Current positions are polled by `poll_positions` and
+                        # command PV's need no subscription.
+                        pv = PV(pvname=pvname, auto_monitor=False)
+                    elif suffix in callbacks:
+                        # Set PV monitoring and callback on the scalar value,
+                        # ignoring alarm-only events.
+                        cb = partial(self.queue_update, callbacks[suffix])
+                        pv = PV(pvname=pvname, auto_monitor=dbr.DBE_VALUE,
+                                count=1, callback=cb)
+                    else:
+                        pv = PV(pvname=pvname)
+
+                    self.pvs[(object, axis, suffix)] = pv
+
+                    # Map callback PV names back to their motor stage.
+                    if suffix in callbacks:
+                        self._pvKeys[pvname] = (object, axis, suffix)
+
+        # Wait for the connections together, the searches being in parallel.
+        deadline = time.monotonic() + 2.0
+        for pv in self.pvs.values():
+            pv.wait_for_connection(timeout=max(deadline - time.monotonic(), 0))
 
         # Print output statement.
         self.append_text("PVs configured and initialized.")
@@ -317,12 +364,10 @@ class Controller(object):
         self.gui.tab.zOMax.setText(text_str_val("ZOMAX_SOFT_LIMIT"))
 
         # Set all offset PV's to the saved offsets.
-        self.PV_XSOFFSET.put(self.gui.macros["XS_OFFSET"])
-        self.PV_YSOFFSET.put(self.gui.macros["YS_OFFSET"])
-        self.PV_ZSOFFSET.put(self.gui.macros["ZS_OFFSET"])
-        self.PV_XOOFFSET.put(self.gui.macros["XO_OFFSET"])
-        self.PV_YOOFFSET.put(self.gui.macros["YO_OFFSET"])
-        self.PV_ZOOFFSET.put(self.gui.macros["ZO_OFFSET"])
+        for object in ["S", "O"]:
+            for axis in ["X", "Y", "Z"]:
+                offset = self.gui.macros[f"{axis}{object}_OFFSET"]
+                self.pvs[(object, axis, "OFFSET")].put(offset)
 
         # Set offset line edits to current PV values.
         self.gui.tab.xSOffset.setText(text_str_val("XS_OFFSET"))
@@ -333,12 +378,10 @@ class Controller(object):
         self.gui.tab.zOOffset.setText(text_str_val("ZO_OFFSET"))
 
         # Set backlash PV values.
-        self.PV_XSB.put(self.gui.macros["XS_BACKLASH"])
-        self.PV_YSB.put(self.gui.macros["YS_BACKLASH"])
-        self.PV_ZSB.put(self.gui.macros["ZS_BACKLASH"])
-        self.PV_XOB.put(self.gui.macros["XO_BACKLASH"])
-        self.PV_YOB.put(self.gui.macros["YO_BACKLASH"])
-        self.PV_ZOB.put(self.gui.macros["ZO_BACKLASH"])
+        for object in ["S", "O"]:
+            for axis in ["X", "Y", "Z"]:
+                backlash = self.gui.macros[f"{axis}{object}_BACKLASH"]
+                self.pvs[(object, axis, "B")].put(backlash)
 
         # Set backlash line edits to current PV values.
         self.gui.tab.xSB.setText(text_str_val("XS_BACKLASH"))
@@ -348,25 +391,23 @@ class Controller(object):
         self.gui.tab.yOB.setText(text_str_val("YO_BACKLASH"))
         self.gui.tab.zOB.setText(text_str_val("ZO_BACKLASH"))
 
-        # Set step line edits to current PV values.
-        self.gui.xSStep.setText(str(float(self.PV_XSSTEP.get())))
-        self.gui.ySStep.setText(str(float(self.PV_YSSTEP.get())))
-        self.gui.zSStep.setText(str(float(self.PV_ZSSTEP.get())))
-        self.gui.xOStep.setText(str(float(self.PV_XOSTEP.get())))
-        self.gui.yOStep.setText(str(float(self.PV_YOSTEP.get())))
-        self.gui.zOStep.setText(str(float(self.PV_ZOSTEP.get())))
-
-        # Set absolute position line edits to current PV values.
-        self.gui.xSAbsPos.setText(str(self.PV_XSABSPOS.get()))
-        self.gui.ySAbsPos.setText(str(self.PV_YSABSPOS.get()))
-        self.gui.zSAbsPos.setText(str(self.PV_ZSABSPOS.get()))
-        self.gui.xOAbsPos.setText(str(self.PV_XOABSPOS.get()))
-        self.gui.yOAbsPos.setText(str(self.PV_YOABSPOS.get()))
-        self.gui.zOAbsPos.setText(str(self.PV_ZOABSPOS.get()))
+        # Set step and absolute position line edits to current PV values,
+        # reading all of them at once.
+        keys = [(object, axis, suffix) for object in ["S", "O"]
+                for axis in ["X", "Y", "Z"] for suffix in ["STEP", "ABSPOS"]]
+        values = caget_many([self.pvs[key].pvname for key in keys])
+        for (object, axis, suffix), value in zip(keys, values):
+            if suffix == "STEP":
+                self._stepEdits[(object, axis)].setText(str(float(value)))
+            else:
+                self._absPosEdits[(object, axis)].setText(str(value))
 
         # Enable Thorlabs motor.
         enable(self.modeMotor)
 
+        # Set current position labels.
+        self.poll_positions()
+
         # Set soft limit indicators.
         for object in ["S", "O"]:
             for axis in ["X", "Y", "Z"]:
@@ -407,99 +448,39 @@ class Controller(object):
         self.gui.tab.TMBMbutton.clicked.connect(
             partial(self.mode_position, "BEAMSPLITTER_POSITION"))
 
-        # Increment sample and objective stage functionality.
-        self.gui.xSN.clicked.connect(
-            partial(self.increment, "S", "X", "N", self.gui.xSStep))
-        self.gui.xSP.clicked.connect(
-            partial(self.increment, "S", "X", "P", self.gui.xSStep))
-        self.gui.ySN.clicked.connect(
-            partial(self.increment, "S", "Y", "N", self.gui.ySStep))
-        self.gui.ySP.clicked.connect(
-            partial(self.increment, "S", "Y", "P", self.gui.ySStep))
-        self.gui.zSN.clicked.connect(
-            partial(self.increment, "S", "Z", "N", self.gui.zSStep))
-        self.gui.zSP.clicked.connect(
-            partial(self.increment, "S", "Z", "P", self.gui.zSStep))
-        self.gui.xON.clicked.connect(
-            partial(self.increment, "O", "X", "N", self.gui.xOStep))
-        self.gui.xOP.clicked.connect(
-            partial(self.increment, "O", "X", "P", self.gui.xOStep))
-        self.gui.yON.clicked.connect(
-            partial(self.increment, "O", "Y", "N", self.gui.yOStep))
-        self.gui.yOP.clicked.connect(
-            partial(self.increment, "O", "Y", "P", self.gui.yOStep))
-        self.gui.zON.clicked.connect(
-            partial(self.increment, "O", "Z", "N", self.gui.zOStep))
-        self.gui.zOP.clicked.connect(
-            partial(self.increment, "O", "Z", "P", self.gui.zOStep))
-
-        # Move sample and objective stage to absolute position functionality.
-        self.gui.xSMove.clicked.connect(partial(self.absolute, "S", "X"))
-        self.gui.ySMove.clicked.connect(partial(self.absolute, "S", "Y"))
-        self.gui.zSMove.clicked.connect(partial(self.absolute, "S", "Z"))
-        self.gui.xOMove.clicked.connect(partial(self.absolute, "O", "X"))
-        self.gui.yOMove.clicked.connect(partial(self.absolute, "O", "Y"))
-        self.gui.zOMove.clicked.connect(partial(self.absolute, "O", "Z"))
-
-        # Continuous motion of the sample and objective stages functionality.
-        self.gui.xSCn.clicked.connect(
-            partial(self.continuous, "S", "X", "CN"))
-        self.gui.xSStop.clicked.connect(
-            partial(self.continuous, "S", "X", "STOP"))
-        self.gui.xSCp.clicked.connect(
-            partial(self.continuous, "S", "X", "CP"))
-        self.gui.ySCn.clicked.connect(
-            partial(self.continuous, "S", "Y", "CN"))
-        self.gui.ySStop.clicked.connect(
-            partial(self.continuous, "S", "Y", "STOP"))
-        self.gui.ySCp.clicked.connect(
-            partial(self.continuous, "S", "Y", "CP"))
-        self.gui.zSCn.clicked.connect(
-            partial(self.continuous, "S", "Z", "CN"))
-        self.gui.zSStop.clicked.connect(
-            partial(self.continuous, "S", "Z", "STOP"))
-        self.gui.zSCp.clicked.connect(
-            partial(self.continuous, "S", "Z", "CP"))
-        self.gui.xOCn.clicked.connect(
-            partial(self.continuous, "O", "X", "CN"))
-        self.gui.xOStop.clicked.connect(
-            partial(self.continuous, "O", "X", "STOP"))
-        self.gui.xOCp.clicked.connect(
-            partial(self.continuous, "O", "X", "CP"))
-        self.gui.yOCn.clicked.connect(
-            partial(self.continuous, "O", "Y", "CN"))
-        self.gui.yOStop.clicked.connect(
-            partial(self.continuous, "O", "Y", "STOP"))
-        self.gui.yOCp.clicked.connect(
-            partial(self.continuous, "O", "Y", "CP"))
-        self.gui.zOCn.clicked.connect(
-            partial(self.continuous, "O", "Z", "CN"))
-        self.gui.zOStop.clicked.connect(
-            partial(self.continuous, "O", "Z", "STOP"))
-        self.gui.zOCp.clicked.connect(
-            partial(self.continuous, "O", "Z", "CP"))
+        guiDict = self.__dict__["gui"].__dict__
+        tabDict = guiDict["tab"].__dict__
+
+        for object in ["S", "O"]:
+            for axis in ["X", "Y", "Z"]:
+                prefix = f"{axis.lower()}{object}"
+
+                # Increment sample and objective stage functionality.
+                for direction in ["N", "P"]:
+                    guiDict[f"{prefix}{direction}"].clicked.connect(partial(
+                        self.increment, object, axis, direction,
+                        guiDict[f"{prefix}Step"]))
+
+                # Move stage to absolute position functionality.
+                guiDict[f"{prefix}Move"].clicked.connect(
+                    partial(self.absolute, object, axis))
+
+                # Continuous motion of the stage functionality.
+                for type in ["CN", "STOP", "CP"]:
+                    guiDict[f"{prefix}{type.capitalize()}"].clicked.connect(
+                        partial(self.continuous, object, axis, type))
+
+                # Zero'ing and un-zero'ing absolute position functionality.
+                tabDict[f"{prefix}Zero"].clicked.connect(
+                    partial(self.zero, object, axis))
+                tabDict[f"{prefix}Actual"].clicked.connect(
+                    partial(self.actual, object, axis))
 
         # Updating soft limits functionality.
         self.gui.tab.SSL.clicked.connect(partial(self.update_soft_lim, 0))
         self.gui.tab.SMSL.clicked.connect(partial(self.update_soft_lim, 1))
         self.gui.tab.SESL.clicked.connect(partial(self.update_soft_lim, 2))
 
-        # Zero'ing absolute position functionality.
-        self.gui.tab.xSZero.clicked.connect(partial(self.zero, "S", "X"))
-        self.gui.tab.ySZero.clicked.connect(partial(self.zero, "S", "Y"))
-        self.gui.tab.zSZero.clicked.connect(partial(self.zero, "S", "Z"))
-        self.gui.tab.xOZero.clicked.connect(partial(self.zero, "O", "X"))
-        self.gui.tab.yOZero.clicked.connect(partial(self.zero, "O", "Y"))
-        self.gui.tab.zOZero.clicked.connect(partial(self.zero, "O", "Z"))
-
-        # Un-zero'ing absolute position functionality.
-        self.gui.tab.xSActual.clicked.connect(partial(self.actual, "S", "X"))
-        self.gui.tab.ySActual.clicked.connect(partial(self.actual, "S", "Y"))
-        self.gui.tab.zSActual.clicked.connect(partial(self.actual, "S", "Z"))
-        self.gui.tab.xOActual.clicked.connect(partial(self.actual, "O", "X"))
-        self.gui.tab.yOActual.clicked.connect(partial(self.actual, "O", "Y"))
-        self.gui.tab.zOActual.clicked.connect(partial(self.actual, "O", "Z"))
-
         # Updating backlash functionality.
         self.gui.tab.SBL.clicked.connect(self.update_backlash)
 
@@ -510,6 +491,10 @@ class Controller(object):
         # Toggle units between steps and microns.
         self.gui.positionUnits.clicked.connect(self.change_units)
 
+        # Report failed image captures.
+        self.gui.camera.saveFailed.connect(
+            partial(self.append_text, color=QColor(255, 0, 0)))
+
         # Load and save configuration functionality.
         self.gui.savePos.clicked.connect(self.save_position)
         self.gui.loadPos.clicked.connect(self.load_position)
@@ -569,18 +554,12 @@ class Controller(object):
         """
 
         # Get the line edit object and check if the current mode is selected.
-        if mode == "TRANSMISSION_POSITION":
-            pos_line_edit = self.gui.tab.TMTM
-            radio_select = self.gui.tab.RDM1.isChecked()
-        elif mode == "REFLECTION_POSITION":
-            pos_line_edit = self.gui.tab.TMRM
-            radio_select = self.gui.tab.RDM2.isChecked()
-        elif mode == "VISIBLE_IMAGE_POSITION":
-            pos_line_edit = self.gui.tab.TMVM
-            radio_select = self.gui.tab.RDM3.isChecked()
-        elif mode == "BEAMSPLITTER_POSITION":
-            pos_line_edit = self.gui.tab.TMBM
-            radio_select = self.gui.tab.RDM4.isChecked()
+        pos_line_edit, radio = self._modeWidgets[mode]
+        radio_select = radio.isChecked()
+
+        # Exit the method if the position is not a complete number.
+        if not self.valid_input(pos_line_edit):
+            return None
 
         # Update the macro mode position variable.
         self.gui.macros[mode] = float(pos_line_edit.text())
@@ -688,8 +667,12 @@ class Controller(object):
         will be updated to take the motor to the soft limit.
         """
 
+        # Exit the method if the step is not a complete number.
+        if not self.valid_input(step):
+            return None
+
         # Get current absolute position and step size.
-        absPos = self.__dict__[f"PV_{axis}{object}POS_ABS"].get()
+        absPos = self.pvs[(object, axis, "POS_ABS")].get()
         incPos = float(step.text())
 
         # If the step size is negative, make it possitive.
@@ -703,15 +686,15 @@ class Controller(object):
         PSL = self.gui.macros[f"{axis}{object}MAX_SOFT_LIMIT"]
         NSL = self.gui.macros[f"{axis}{object}MIN_SOFT_LIMIT"]
 
-        # Change step size if it breaches soft limits.
-        if direction == "P" and absPos + incPos > PSL:
-            incPos = PSL - absPos
-        elif direction == "N" and absPos - incPos < NSL:
-            incPos = absPos - NSL
+        # Shorten the step if it breaches soft limits.
+        if direction == "P":
+            incPos = min(incPos, PSL - absPos)
+        else:
+            incPos = min(incPos, absPos - NSL)
 
         # Write to process variables.
-        self.__dict__[f"PV_{axis}{object}STEP"].put(incPos)
-        caput(self.gui.macros[f"{axis}{object}{direction}"], 1)
+        self.pvs[(object, axis, "STEP")].put(incPos)
+        self.pvs[(object, axis, direction)].put(1)
 
     def absolute(self, object: Literal["S", "O"], axis:
                  Literal["X", "Y", "Z"]) -> None:
@@ -734,24 +717,50 @@ class Controller(object):
         """
 
         # Get absolute position.
-        absPosLineEdit = self.__dict__["gui"].__dict__[f"{axis.lower()}{object}AbsPos"]
+        absPosLineEdit = self._absPosEdits[(object, axis)]
+        if not self.valid_input(absPosLineEdit):
+            return None
         absPos = float(absPosLineEdit.text())
-        absPosLineEdit.setText(str(absPos))
+        if absPosLineEdit.text() != str(absPos):
+            absPosLineEdit.setText(str(absPos))
 
         # Get spft limits.
         PSL = self.gui.macros[f"{axis}{object}MAX_SOFT_LIMIT"]
         NSL = self.gui.macros[f"{axis}{object}MIN_SOFT_LIMIT"]
 
-        # Change absolute position if it breaches soft limits.
-        if absPos > PSL:
-            absPos = PSL
-        elif absPos < NSL:
-            absPos = NSL
+        # Clamp the absolute position to the soft limits.
+        absPos = min(max(absPos, NSL), PSL)
 
         # Write to process variables.
-        self.__dict__[f"PV_{axis}{object}ABSPOS"].put(absPos)
-        self.__dict__[f"PV_{axis}{object}MOVE"].put(1)
-        self.__dict__[f"PV_{axis}{object}MOVE"].put(0)
+        self.move(object, axis, absPos)
+
+    def move(self, object: Literal["S", "O"], axis: Literal["X", "Y", "Z"],
+             absPos: float) -> None:
+        """Start a move to an absolute position.
+
+        This method writes `absPos` to the absolute position process variable
+        of the motor defined by `object` and `axis` and pulses its move process
+        variable.
+
+        Parameters
+        ----------
+        object : {"S", "O"}
+            Defines the stage as either sample ("S") or orbjective ("O").
+        axis : {"X", "Y", "Z"}
+            Defines the motor axis as x, y, or z.
+        absPos : float
+            Absolute position to move to.
+
+        Notes
+        -----
+        The puts do not wait for completion, so the pulse is queued as two
+        channel access writes without waiting on a round trip in between.
+        """
+
+        movePV = self.pvs[(object, axis, "MOVE")]
+        self.pvs[(object, axis, "ABSPOS")].put(absPos, wait=False)
+        movePV.put(1, wait=False)
+        movePV.put(0, wait=False)
 
     def continuous(self, object: Literal["S", "O"], axis:
                    Literal["X", "Y", "Z"], type:
@@ -778,17 +787,29 @@ class Controller(object):
         The program will write the inbound soft limit to the continuous motion
         proces variables so that it will stop at the soft limit if "STOP" is
         not pressed.
+
+        Repeated presses of the same continuous motion button within
+        `CONTINUOUS_DEBOUNCE` seconds are ignored as the motor is already
+        moving towards that limit. "STOP" is never ignored.
         """
 
+        # Ignore rapidly repeated continuous motion commands.
+        now = time.monotonic()
+        last = self._lastContinuous.get((object, axis))
+        if (type != "STOP" and last is not None and last[0] == type
+                and now - last[1] < self.CONTINUOUS_DEBOUNCE):
+            return
+        self._lastContinuous[(object, axis)] = (type, now)
+
         if type == "CN":
-            caput(self.gui.macros[f"{axis}{object}CN"],
-                  self.gui.macros[f"{axis}{object}MIN_SOFT_LIMIT"])
+            self.pvs[(object, axis, "CN")].put(
+                self.gui.macros[f"{axis}{object}MIN_SOFT_LIMIT"])
         elif type == "CP":
-            caput(self.gui.macros[f"{axis}{object}CP"],
-                  self.gui.macros[f"{axis}{object}MAX_SOFT_LIMIT"])
+            self.pvs[(object, axis, "CP")].put(
+                self.gui.macros[f"{axis}{object}MAX_SOFT_LIMIT"])
         else:
-            self.__dict__[f"PV_{axis}{object}STOP"].put(1)
-            self.__dict__[f"PV_{axis}{object}STOP"].put(0)
+            self.pvs[(object, axis, "STOP")].put(1)
+            self.pvs[(object, axis, "STOP")].put(0)
 
     def update_soft_lim(self, buttonID: Literal[0, 1, 2]) -> None:
         """Update sample and objective soft limits.
@@ -813,100 +834,71 @@ class Controller(object):
         will not update the soft limit.
         """
 
-        if buttonID == 2:
-            # Set soft limits to hard limits.
-            self.gui.macros["XSMIN_SOFT_LIMIT"] = float(
-                self.gui.macros["XSMIN_HARD_LIMIT"])
-            self.gui.macros["XSMAX_SOFT_LIMIT"] = float(
-                self.gui.macros["XSMAX_HARD_LIMIT"])
-            self.gui.macros["YSMIN_SOFT_LIMIT"] = float(
-                self.gui.macros["YSMIN_HARD_LIMIT"])
-            self.gui.macros["YSMAX_SOFT_LIMIT"] = float(
-                self.gui.macros["YSMAX_HARD_LIMIT"])
-            self.gui.macros["ZSMIN_SOFT_LIMIT"] = float(
-                self.gui.macros["ZSMIN_HARD_LIMIT"])
-            self.gui.macros["ZSMAX_SOFT_LIMIT"] = float(
-                self.gui.macros["ZSMAX_HARD_LIMIT"])
-            self.gui.macros["XOMIN_SOFT_LIMIT"] = float(
-                self.gui.macros["XOMIN_HARD_LIMIT"])
-            self.gui.macros["XOMAX_SOFT_LIMIT"] = float(
-                self.gui.macros["XOMAX_HARD_LIMIT"])
-            self.gui.macros["YOMIN_SOFT_LIMIT"] = float(
-                self.gui.macros["YOMIN_HARD_LIMIT"])
-            self.gui.macros["YOMAX_SOFT_LIMIT"] = float(
-                self.gui.macros["YOMAX_HARD_LIMIT"])
-            self.gui.macros["ZOMIN_SOFT_LIMIT"] = float(
-                self.gui.macros["ZOMIN_HARD_LIMIT"])
-            self.gui.macros["ZOMAX_SOFT_LIMIT"] = float(
-                self.gui.macros["ZOMAX_HARD_LIMIT"])
-
-        elif buttonID == 1:
-            # Set soft limits to zero.
-            self.gui.macros["XSMIN_SOFT_LIMIT"] = float(0)
-            self.gui.macros["XSMAX_SOFT_LIMIT"] = float(0)
-            self.gui.macros["YSMIN_SOFT_LIMIT"] = float(0)
-            self.gui.macros["YSMAX_SOFT_LIMIT"] = float(0)
-            self.gui.macros["ZSMIN_SOFT_LIMIT"] = float(0)
-            self.gui.macros["ZSMAX_SOFT_LIMIT"] = float(0)
-            self.gui.macros["XOMIN_SOFT_LIMIT"] = float(0)
-            self.gui.macros["XOMAX_SOFT_LIMIT"] = float(0)
-            self.gui.macros["YOMIN_SOFT_LIMIT"] = float(0)
-            self.gui.macros["YOMAX_SOFT_LIMIT"] = float(0)
-            self.gui.macros["ZOMIN_SOFT_LIMIT"] = float(0)
-            self.gui.macros["ZOMAX_SOFT_LIMIT"] = float(0)
+        tabDict = self.__dict__["gui"].__dict__["tab"].__dict__
 
-        else:
-            # Set soft limits to input values
-            for object in ["S", "O"]:
-                for axis in ["X", "Y", "Z"]:
+        # Exit the method if an input limit is not a complete number.
+        if buttonID == 0 and not self.valid_input(*[
+                tabDict[f"{axis.lower()}{object}{bound}"]
+                for object in ["S", "O"] for axis in ["X", "Y", "Z"]
+                for bound in ["Min", "Max"]]):
+            return None
+
+        for object in ["S", "O"]:
+            for axis in ["X", "Y", "Z"]:
 
-                    offset = self.__dict__[f"PV_{axis}{object}OFFSET"].get()
+                min_soft_ind = f"{axis}{object}MIN_SOFT_LIMIT"
+                max_soft_ind = f"{axis}{object}MAX_SOFT_LIMIT"
 
-                    tabDict = self.__dict__["gui"].__dict__["tab"].__dict__
+                min_hard = self.gui.macros[f"{axis}{object}MIN_HARD_LIMIT"]
+                max_hard = self.gui.macros[f"{axis}{object}MAX_HARD_LIMIT"]
+
+                if buttonID == 2:
+                    # Set soft limits to hard limits.
+                    self.gui.macros[min_soft_ind] = float(min_hard)
+                    self.gui.macros[max_soft_ind] = float(max_hard)
+
+                elif buttonID == 1:
+                    # Set soft limits to zero.
+                    self.gui.macros[min_soft_ind] = float(0)
+                    self.gui.macros[max_soft_ind] = float(0)
+
+                else:
+                    # Set soft limits to input values.
+                    offset = self.pvs[(object, axis, "OFFSET")].get()
 
                     # Get the input limits.
-                    min = float(tabDict[
+                    minLim = float(tabDict[
                         f"{axis.lower()}{object}Min"].text()) - offset
-                    max = float(tabDict[
+                    maxLim = float(tabDict[
                         f"{axis.lower()}{object}Max"].text()) - offset
 
                     # Check if the minimum limit is greater than the upper.
-                    if min > max:
+                    if minLim > maxLim:
                         self.append_text(f"WARNING: Invalid limit. Minimum limits must be less then maximum limits.",
                                          QColor(250, 215, 0))
 
                     else:
-                        min_soft_ind = f"{axis}{object}MIN_SOFT_LIMIT"
-                        max_soft_ind = f"{axis}{object}MAX_SOFT_LIMIT"
-
-                        min_hard = self.gui.macros[f"{axis}{object}MIN_HARD_LIMIT"]
-                        max_hard = self.gui.macros[f"{axis}{object}MAX_HARD_LIMIT"]
-
-                        # Check that the new limit is within the hard limits.
-                        val = min_hard if min < min_hard else min
-                        self.gui.macros[min_soft_ind] = val
-
-                        # Check that the new limit is within the hard limits.
-                        val = max_hard if max > max_hard else max
-                        self.gui.macros[max_soft_ind] = val
-
-        # Create heler function to generate soft limit text.
-        def set(label: str, offset: PV) -> str:
-            return str(self.gui.macros[label] + offset.get())
-
-        # Update soft limit line edits.
-        self.gui.tab.xSMin.setText(set("XSMIN_SOFT_LIMIT", self.PV_XSOFFSET))
-        self.gui.tab.xSMax.setText(set("XSMAX_SOFT_LIMIT", self.PV_XSOFFSET))
-        self.gui.tab.ySMin.setText(set("YSMIN_SOFT_LIMIT", self.PV_YSOFFSET))
-        self.gui.tab.ySMax.setText(set("YSMAX_SOFT_LIMIT", self.PV_YSOFFSET))
-        self.gui.tab.zSMin.setText(set("ZSMIN_SOFT_LIMIT", self.PV_ZSOFFSET))
-        self.gui.tab.zSMax.setText(set("ZSMAX_SOFT_LIMIT", self.PV_ZSOFFSET))
-        self.gui.tab.xOMin.setText(set("XOMIN_SOFT_LIMIT", self.PV_XOOFFSET))
-        self.gui.tab.xOMax.setText(set("XOMAX_SOFT_LIMIT", self.PV_XOOFFSET))
-        self.gui.tab.yOMin.setText(set("YOMIN_SOFT_LIMIT", self.PV_YOOFFSET))
-        self.gui.tab.yOMax.setText(set("YOMAX_SOFT_LIMIT", self.PV_YOOFFSET))
-        self.gui.tab.zOMin.setText(set("ZOMIN_SOFT_LIMIT", self.PV_ZOOFFSET))
-        self.gui.tab.zOMax.setText(set("ZOMAX_SOFT_LIMIT", self.PV_ZOOFFSET))
+                        # Clamp the new limits to within the hard limits.
+                        self.gui.macros[min_soft_ind] = max(minLim, min_hard)
+                        self.gui.macros[max_soft_ind] = min(maxLim, max_hard)
+
+        # Update soft limit line edits, reading each offset only once.
+        for object in ["S", "O"]:
+            for axis in ["X", "Y", "Z"]:
+
+                offset = self.pvs[(object, axis, "OFFSET")].get()
+
+                minLim = self.gui.macros[f"{axis}{object}MIN_SOFT_LIMIT"]
+                maxLim = self.gui.macros[f"{axis}{object}MAX_SOFT_LIMIT"]
+
+                minEdit = tabDict[f"{axis.lower()}{object}Min"]
+                maxEdit = tabDict[f"{axis.lower()}{object}Max"]
+
+                # Only rewrite line edits whose text changes.
+                for lineEdit, value in [(minEdit, minLim), (maxEdit, maxLim)]:
+                    text = str(value + offset)
+                    if lineEdit.text() != text:
+                        lineEdit.setText(text)
 
         # Move motors to within soft limits.
         self.check_motor_position()
@@ -927,34 +919,85 @@ class Controller(object):
         """
 
         tabDict = self.__dict__["gui"].__dict__["tab"].__dict__
+        stages = [(o, a) for o in ["S", "O"] for a in ["X", "Y", "Z"]]
+
+        # Exit the method if a backlash is not a complete number.
+        if not self.valid_input(*[tabDict[f"{axis.lower()}{object}B"]
+                                  for object, axis in stages]):
+            return None
+
+        # Parse all inputs before writing so a bad input changes nothing.
+        backlash = {(object, axis): abs(int(float(
+            tabDict[f"{axis.lower()}{object}B"].text())))
+            for object, axis in stages}
+
+        for object, axis in stages:
+            value = backlash[(object, axis)]
 
-        # Set global backlash variables (used to save configuration files).
-        self.gui.macros["XS_BACKLASH"] = abs(int(float(tabDict["xSB"].text())))
-        self.gui.macros["YS_BACKLASH"] = abs(int(float(tabDict["ySB"].text())))
-        self.gui.macros["ZS_BACKLASH"] = abs(int(float(tabDict["zSB"].text())))
-        self.gui.macros["XO_BACKLASH"] = abs(int(float(tabDict["xOB"].text())))
-        self.gui.macros["YO_BACKLASH"] = abs(int(float(tabDict["yOB"].text())))
-        self.gui.macros["ZO_BACKLASH"] = abs(int(float(tabDict["zOB"].text())))
-
-        # Set backlash process variables.
-        self.PV_XSB.put(self.gui.macros["XS_BACKLASH"])
-        self.PV_YSB.put(self.gui.macros["YS_BACKLASH"])
-        self.PV_ZSB.put(self.gui.macros["ZS_BACKLASH"])
-        self.PV_XOB.put(self.gui.macros["XO_BACKLASH"])
-        self.PV_YOB.put(self.gui.macros["YO_BACKLASH"])
-        self.PV_ZOB.put(self.gui.macros["ZO_BACKLASH"])
-
-        # Reset backlash line edits for consistent formatting.
-        self.gui.tab.xSB.setText(str(float(self.gui.macros["XS_BACKLASH"])))
-        self.gui.tab.ySB.setText(str(float(self.gui.macros["YS_BACKLASH"])))
-        self.gui.tab.zSB.setText(str(float(self.gui.macros["ZS_BACKLASH"])))
-        self.gui.tab.xOB.setText(str(float(self.gui.macros["XO_BACKLASH"])))
-        self.gui.tab.yOB.setText(str(float(self.gui.macros["YO_BACKLASH"])))
-        self.gui.tab.zOB.setText(str(float(self.gui.macros["ZO_BACKLASH"])))
+            # Set global backlash variable (used to save configuration files).
+            self.gui.macros[f"{axis}{object}_BACKLASH"] = value
+
+            # Set backlash process variable.
+            self.pvs[(object, axis, "B")].put(value)
+
+            # Reset backlash line edit for consistent formatting.
+            lineEdit = tabDict[f"{axis.lower()}{object}B"]
+            text = str(float(value))
+            if lineEdit.text() != text:
+                lineEdit.setText(text)
 
         # Print output statement
         self.append_text("Updating backlash values.")
 
+    def queue_update(self, handler: Callable, **kwargs:
+                     Dict[str, Any]) -> None:
+        """Queue a process variable update for the user interface.
+
+        This method serves as the callback function of the monitored process
+        variables. It stores the latest value of the process variable such
+        that `handler` is called with it on the next `apply_updates` call and
+        signals the GUI thread to schedule that call.
+
+        Parameters
+        ----------
+        handler : Callable
+            Method updating the user interface from the process variable.
+        **kwargs : dict
+            Extra arguments to `queue_update`: refer to PyEpics documentation
+            for a list of all possible arguments for PV callback functions.
+
+        Notes
+        -----
+        PyEpics calls this method from its channel access thread. Widgets are
+        not touched here so that the thread returns immediately and bursts of
+        updates to the same process variable collapse into a single update.
+        The signal is delivered to the GUI thread through a queued connection.
+        """
+
+        self._pendingUpdates[kwargs["pvname"]] = (handler, kwargs["value"])
+        self._bridge.updateQueued.emit()
+
+    def schedule_updates(self) -> None:
+        """Schedule the application of queued process variable updates.
+
+        This method starts the update timer unless it is already running, such
+        that all updates queued in the meantime are applied together.
+        """
+
+        if not self.updateTimer.isActive():
+            self.updateTimer.start()
+
+    def apply_updates(self) -> None:
+        """Apply queued process variable updates.
+
+        This method is called by the update timer to pass the latest queued
+        value of each process variable to its handler on the GUI thread.
+        """
+
+        while self._pendingUpdates:
+            pvname, (handler, value) = self._pendingUpdates.popitem()
+            handler(pvname=pvname, value=value)
+
     def motor_status(self, **kwargs: Dict[str, Any]) -> None:
         """Set motor status indicators.
 
@@ -971,50 +1014,34 @@ class Controller(object):
         -----
         The `soft_lim_indicators` method is called within to approximate
         live soft limit updating by polling.
+
+        The label is only updated when the status changes. Its style sheet is
+        set once and the status only toggles its "motorState" property, such
+        that no style sheet is re-parsed.
         """
 
         # Get process variable information.
         pvname = kwargs["pvname"]
         value = kwargs["value"]
 
-        # Get the process variable name.
-        keys = list(self.gui.macros.keys())
-        vals = list(self.gui.macros.values())
-        pvKey = keys[vals.index(pvname)]
-
         # Get the motor stage information.
-        axis = pvKey[0]
-        object = pvKey[1]
-
-        label = self.__dict__["gui"].__dict__[f"{axis.lower()}Idle{object}"]
+        object, axis, _ = self._pvKeys[pvname]
 
+        # Poll soft limit checks for "live" limit indicator updates.
         if value == 0:
-            text = "IDLE"
-            style = "background-color: lightgrey; border: 1px solid black;"
-
-            # Poll soft limit checks for "live" limit indicator updates.
             self.soft_lim_indicators(object, axis)
-        elif value == 1:
-            text = "POWERING"
-            style = "background-color: #ff4747; border: 1px solid black;"
-        elif value == 2:
-            text = "POWERED"
-            style = "background-color: #ff4747; border: 1px solid black;"
-        elif value == 3:
-            text = "RELEASING"
-            style = "background-color: #edde07; border: 1px solid black;"
-        elif value == 4:
-            text = "ACTIVE"
-            style = "background-color: #3ac200; border: 1px solid black;"
-        elif value == 5:
-            text = "APPLYING"
-            style = "background-color: #edde07; border: 1px solid black;"
-        else:
-            text = "UNPOWERING"
-            style = "background-color: #ff4747; border: 1px solid black;"
+
+        text, _ = self.STATUS.get(value, self.STATUS[6])
+        label = self._statusLabels[(object, axis)]
+
+        # Skip the update if the status has not changed.
+        if label.property("motorState") == text:
+            return
 
         label.setText(text)
-        label.setStyleSheet(style)
+        label.setProperty("motorState", text)
+        label.style().unpolish(label)
+        label.style().polish(label)
 
     def check_motor_position(self) -> None:
         """Assert motor positions are within soft limits.
@@ -1035,17 +1062,13 @@ class Controller(object):
                 PSL = self.gui.macros[f"{axis}{object}MAX_SOFT_LIMIT"]
                 NSL = self.gui.macros[f"{axis}{object}MIN_SOFT_LIMIT"]
 
-                currPos = self.__dict__[f"PV_{axis}{object}POS_ABS"].get()
+                currPos = self.pvs[(object, axis, "POS_ABS")].get()
 
                 # If position breaches a limit, move to that limit.
                 if currPos >= PSL:
-                    self.__dict__[f"PV_{axis}{object}ABSPOS"].put(PSL)
-                    self.__dict__[f"PV_{axis}{object}MOVE"].put(1)
-                    self.__dict__[f"PV_{axis}{object}MOVE"].put(0)
+                    self.move(object, axis, PSL)
                 elif currPos <= NSL:
-                    self.__dict__[f"PV_{axis}{object}ABSPOS"].put(NSL)
-                    self.__dict__[f"PV_{axis}{object}MOVE"].put(1)
-                    self.__dict__[f"PV_{axis}{object}MOVE"].put(0)
+                    self.move(object, axis, NSL)
 
     def soft_lim_indicators(self, object: Literal["S", "O"], axis:
                             Literal["X", "Y", "Z"]) -> None:
@@ -1063,21 +1086,19 @@ class Controller(object):
             Defines the motor axis as x, y, or z.
         """
 
-        value = self.__dict__[f"PV_{axis}{object}POS"].get()
+        # Use the last polled position to avoid a network round trip.
+        value = self._positions.get((object, axis))
+        if value is None:
+            return
 
-        negLim = self.__dict__["gui"].__dict__[f"{axis.lower()}{object}Sn"]
-        posLim = self.__dict__["gui"].__dict__[f"{axis.lower()}{object}Sp"]
+        negLim, posLim = self._softLimLabels[(object, axis)]
 
         minSoftLim = self.gui.macros[f"{axis}{object}MIN_SOFT_LIMIT"]
         maxSoftLim = self.gui.macros[f"{axis}{object}MAX_SOFT_LIMIT"]
 
-        # Define style sheets.
-        grey = "background-color: lightgrey; border: 1px solid black;"
-        green = "background-color: #3ac200; border: 1px solid black;"
-
         # Set minimum and maximum soft limit indicators.
-        negLim.setStyleSheet(green if value <= minSoftLim else grey)
-        posLim.setStyleSheet(green if maxSoftLim <= value else grey)
+        self.set_limit_indicator(negLim, value <= minSoftLim)
+        self.set_limit_indicator(posLim, maxSoftLim <= value)
 
     def hard_lim_indicators(self, **kwargs: Dict[str, Any]) -> None:
         """Set hard limit indicators.
@@ -1098,26 +1119,35 @@ class Controller(object):
         pvname = kwargs["pvname"]
         value = kwargs["value"]
 
-        # Get the process variable name.
-        keys = list(self.gui.macros.keys())
-        vals = list(self.gui.macros.values())
-        pvKey = keys[vals.index(pvname)]
+        # Get the hard limit label, keyed like the process variable.
+        label = self._hardLimLabels[self._pvKeys[pvname]]
 
-        # Get the motor stage information.
-        axis = pvKey[0]
-        object = pvKey[1]
-        direction = pvKey[3]
+        # Set hard limit indicator.
+        self.set_limit_indicator(label, value > 0)
 
-        # Get the hard limit label.
-        label = self.__dict__["gui"].__dict__[
-            f"{axis.lower()}{object}H{direction.lower()}"]
+    def set_limit_indicator(self, label: QLabel, active: bool) -> None:
+        """Set a limit indicator.
 
-        # Set style sheets.
-        green = "background-color: #3ac200; border: 1px solid black;"
-        grey = "background-color: lightgrey; border: 1px solid black;"
+        This method illuminates the limit indicator `label` if `active` is true
+        and greys it out otherwise.
 
-        # Set hard limit indicator.
-        label.setStyleSheet(green if value > 0 else grey)
+        Parameters
+        ----------
+        label : QLabel
+            Soft or hard limit indicator styled by `LIMIT_STYLE`.
+        active : bool
+            Whether the limit has been reached.
+        """
+
+        state = "on" if active else "off"
+
+        # Skip the repolish if the indicator has not changed.
+        if label.property("limitState") == state:
+            return
+
+        label.setProperty("limitState", state)
+        label.style().unpolish(label)
+        label.style().polish(label)
 
     def change_display_vals(self, **kwargs: Dict[str, Any]) -> None:
         """Toggle display values between actual and relative.
@@ -1137,11 +1167,7 @@ class Controller(object):
 
         # Get process variable and motor stage information.
         pvname = kwargs["pvname"]
-        keys = list(self.gui.macros.keys())
-        vals = list(self.gui.macros.values())
-        pvKey = keys[vals.index(pvname)]
-        axis = pvKey[0]
-        object = pvKey[1]
+        object, axis, _ = self._pvKeys[pvname]
 
         guiDict = self.__dict__["gui"].__dict__
 
@@ -1151,11 +1177,11 @@ class Controller(object):
         maxSoftLim = guiDict["tab"].__dict__[f"{axis.lower()}{object}Max"]
         offsetLabel = guiDict["tab"].__dict__[f"{axis.lower()}{object}Offset"]
 
-        offset = self.__dict__[f"PV_{axis}{object}OFFSET"].get()
-        currAbsPos = self.__dict__[f"PV_{axis}{object}POS_ABS"].get()
+        offset = self.pvs[(object, axis, "OFFSET")].get()
+        currAbsPos = self.pvs[(object, axis, "POS_ABS")].get()
 
         # Update the absolute position line edit.
-        self.__dict__[f"PV_{axis}{object}ABSPOS"].put(currAbsPos)
+        self.pvs[(object, axis, "ABSPOS")].put(currAbsPos)
 
         # Update the hard limit indicators.
         minLim = self.gui.macros[f"{axis}{object}MIN_HARD_LIMIT"] + offset
@@ -1165,8 +1191,9 @@ class Controller(object):
         # Update the soft limit indicators.
         minLim = self.gui.macros[f"{axis}{object}MIN_SOFT_LIMIT"] + offset
         maxLim = self.gui.macros[f"{axis}{object}MAX_SOFT_LIMIT"] + offset
-        minSoftLim.setText(str(minLim))
-        maxSoftLim.setText(str(maxLim))
+        with QSignalBlocker(minSoftLim), QSignalBlocker(maxSoftLim):
+            minSoftLim.setText(str(minLim))
+            maxSoftLim.setText(str(maxLim))
 
         # Update the offset label.
         offsetLabel.setText(str(offset))
@@ -1234,11 +1261,11 @@ class Controller(object):
         to be called to update the display values.
         """
 
-        caput(self.gui.macros[f"{axis}{object}ZERO"], 1)
-        caput(self.gui.macros[f"{axis}{object}ZERO"], 0)
+        self.pvs[(object, axis, "ZERO")].put(1)
+        self.pvs[(object, axis, "ZERO")].put(0)
 
-        self.gui.macros[f"{axis}{object}_OFFSET"] = self.__dict__[
-            f"PV_{axis}{object}OFFSET"].get()
+        offset = self.pvs[(object, axis, "OFFSET")].get()
+        self.gui.macros[f"{axis}{object}_OFFSET"] = offset
 
         # Print output statement.
         self.append_text(f"Zero'ing the {axis}{object}ABSPOS line edit.")
@@ -1266,46 +1293,119 @@ class Controller(object):
         """
 
         # Set offset value to zero.
-        self.__dict__[f"PV_{axis}{object}OFFSET"].put(0)
+        self.pvs[(object, axis, "OFFSET")].put(0)
         self.gui.macros[f"{axis}{object}_OFFSET"] = 0
 
-    def set_current_position(self, **kwargs: Dict[str, Any]) -> None:
+    def poll_positions(self) -> None:
+        """Poll the current position process variables.
+
+        This method is called periodically by the position timer to read the
+        current position of each motor stage and update the current position
+        labels and soft limit indicators of those that have moved.
+
+        Notes
+        -----
+        The current position process variables are not monitored as they
+        update at the full IOC rate while a motor is moving. Polling them at a
+        fixed rate bounds the network traffic and label updates they generate.
+        """
+
+        # Skip disconnected PV's, whose reads would block the GUI thread for
+        # the full connection timeout while their IOC is down.
+        stages = [(object, axis) for object in ["S", "O"]
+                  for axis in ["X", "Y", "Z"]
+                  if self.pvs[(object, axis, "POS")].connected]
+        if not stages:
+            return None
+        pvnames = [self.pvs[(object, axis, "POS")].pvname
+                   for object, axis in stages]
+
+        # Issue all reads at once rather than one round trip per motor.
+        values = caget_many(pvnames, timeout=0.1)
+
+        for (object, axis), value in zip(stages, values):
+
+            # Only update the label if the position has changed.
+            lastValue = self._positions.get((object, axis))
+            if value is None or value == lastValue:
+                continue
+
+            self._positions[(object, axis)] = value
+            self.set_current_position(object, axis, value)
+            self.soft_lim_indicators(object, axis)
+
+    def set_current_position(self, object: Literal["S", "O"], axis:
+                             Literal["X", "Y", "Z"], value: float) -> None:
         """Update current position label.
 
-        This method is called at each change of the current position process
-        variable to update current position label.
+        This method is called by `poll_positions` at each change of the current
+        position process variable to update current position label.
 
         Parameters
         ----------
-        **kwargs : dict
-            Extra arguments to `set_current_position`: refer to PyEpics
-            documentation for a list of all possible arguments for PV callback
-            functions.
+        object : {"S", "O"}
+            Defines the stage as either sample ("S") or orbjective ("O").
+        axis : {"X", "Y", "Z"}
+            Defines the motor axis as x, y, or z.
+        value : float
+            Current position in steps.
         """
 
-        # Get process variable information.
-        pvname = kwargs["pvname"]
-        value = kwargs["value"]
+        # Update the step label text.
+        stepLabel = self._stepLabels[(object, axis)]
+        stepLabel.setText(self.position_text(object, axis, value))
 
-        # Get process variable name.
-        keys = list(self.gui.macros.keys())
-        vals = list(self.gui.macros.values())
-        pvKey = keys[vals.index(pvname)]
+    def position_text(self, object: Literal["S", "O"], axis:
+                      Literal["X", "Y", "Z"], value: float) -> str:
+        """Format a current position label.
 
-        # Get motor information.
-        axis = pvKey[0]
-        object = pvKey[1]
+        This method formats the current position `value`, given in steps, in
+        the display units selected in the GUI.
+
+        Parameters
+        ----------
+        object : {"S", "O"}
+            Defines the stage as either sample ("S") or orbjective ("O").
+        axis : {"X", "Y", "Z"}
+            Defines the motor axis as x, y, or z.
+        value : float
+            Current position in steps.
+
+        Returns
+        -------
+        str
+            Rich text of the current position label.
+        """
 
-        # Generate label text.
         if self.gui.positionUnits.isChecked():
             factor = self.gui.macros[f"{axis}{object}_STEP2MICRON"]
-            stepText = f"<b>{round(factor * value, 1)} MICRONS</b>"
-        else:
-            stepText = f"<b>{round(value, 1)} STEPS</b>"
+            return self.MICRONS_TEXT % (factor * value)
+        return self.STEPS_TEXT % value
 
-        # Update the step label text.
-        stepLabel = self.__dict__["gui"].__dict__[f"{axis.lower()}Step{object}"]
-        stepLabel.setText(stepText)
+    def valid_input(self, *lineEdits: QLineEdit) -> bool:
+        """Check numeric line edits hold acceptable input.
+
+        This method reports an error to the console window if any of
+        `lineEdits` holds input its validator does not accept, such as an
+        empty field or a partly typed number.
+
+        Parameters
+        ----------
+        *lineEdits : QLineEdit
+            The numeric line edits to be checked.
+
+        Returns
+        -------
+        bool
+            True if all line edits hold complete numbers, False otherwise.
+        """
+
+        if all(lineEdit.hasAcceptableInput() for lineEdit in lineEdits):
+            return True
+
+        self.append_text("ERROR: Invalid number, correct the input and try again.",
+                         QColor(255, 0, 0))
+        return False
 
     def append_text(self, text: str, color: QColor=QColor(0, 0, 0)) -> None:
         """Append text to console window.
@@ -1402,19 +1502,14 @@ class Controller(object):
         for object in ["O", "S"]:
             for axis in ["X", "Y", "Z"]:
 
-                # Get the current position.
-                value = self.__dict__[f"PV_{axis}{object}POS"].get()
-
-                # Generate the step text.
-                if self.gui.positionUnits.isChecked():
-                    factor = self.gui.macros[f"{axis}{object}_STEP2MICRON"]
-                    stepText = f"<b>{round(factor * value, 1)} MICRONS</b>"
-                else:
-                    stepText = f"<b>{round(value, 1)} STEPS</b>"
+                # Get the last polled current position.
+                value = self._positions.get((object, axis))
+                if value is None:
+                    continue
 
                 # Update the current position label text.
-                stepLabel = self.__dict__["gui"].__dict__[f"{axis.lower()}Step{object}"]
-                stepLabel.setText(stepText)
+                stepLabel = self._stepLabels[(object, axis)]
+                stepLabel.setText(self.position_text(object, axis, value))
 
     def save_position(self):
         """Save the current position to a configuration file.
@@ -1444,12 +1539,10 @@ class Controller(object):
 
             # Generate position dictionary.
             position = {}
-            position["XS"] = self.PV_XSPOS_ABS.get()
-            position["YS"] = self.PV_YSPOS_ABS.get()
-            position["ZS"] = self.PV_ZSPOS_ABS.get()
-            position["XO"] = self.PV_XOPOS_ABS.get()
-            position["YO"] = self.PV_YOPOS_ABS.get()
-            position["ZO"] = self.PV_ZOPOS_ABS.get()
+            for object in ["S", "O"]:
+                for axis in ["X", "Y", "Z"]:
+                    pv = self.pvs[(object, axis, "POS_ABS")]
+                    position[f"{axis}{object}"] = pv.get()
 
             # Save position into dynamic memory.
             self.gui.savedPos[label] = position
@@ -1509,10 +1602,8 @@ class Controller(object):
                                      QColor(255, 0, 0))
                 else:
                     # Load and move to position.
-                    offset = self.__dict__[f"PV_{axis}{object}OFFSET"].get()
-                    self.__dict__[f"PV_{axis}{object}ABSPOS"].put(absPos + offset)
-                    self.__dict__[f"PV_{axis}{object}MOVE"].put(1)
-                    self.__dict__[f"PV_{axis}{object}MOVE"].put(0)
+                    offset = self.pvs[(object, axis, "OFFSET")].get()
+                    self.move(object, axis, absPos + offset)
 
         # Print output statement.
         self.append_text(f"Position loaded: {label}")
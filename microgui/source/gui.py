@@ -6,16 +6,19 @@ creating the main user interface with the FAR-IR Horizontal Microscope.
 
 
 from flir_camera_control import get_image
-from PyQt5.QtGui import QPixmap, QFont, QIcon
-from PyQt5.QtCore import QRectF, QTimer, Qt
+from PIL import Image
+from PyQt5.QtGui import QDoubleValidator, QPixmap, QFont, QIcon
+from PyQt5.QtCore import (
+    pyqtSignal, QLocale, QObject, QRectF, QRunnable, QThreadPool, QTimer, Qt
+)
 from PyQt5.QtWidgets import (
     QButtonGroup, QComboBox, QDockWidget, QGridLayout, QLabel, QLineEdit,
     QMainWindow, QPushButton, QRadioButton, QScrollBar, QTabWidget,
     QTextBrowser, QVBoxLayout, QWidget, QFileDialog
 )
 from typing import Any
-import matplotlib.pyplot as plt
 import numpy as np
+import os
 import pyqtgraph as pg
 import pyqtgraph.ptime as ptime
 
@@ -43,6 +46,8 @@ class GUI(QMainWindow):
         Dictionary containing macro variables.
     tab : MyTableWidget object
         The tabular display located on the main GUI window.
+    camera : CameraWindow object
+        The detachable live feed window located on the main GUI window.
     xSN, ySN, zSN : QPushButton
         Negative incrment button for the sample's x, y, and z dimensions.
     xSP, ySP, zSP : QPushButton
@@ -168,12 +173,30 @@ class GUI(QMainWindow):
         # Add sub-windows to main window layout.
         self.layout = QGridLayout()
         self.layout.addWidget(self.diagram_window(), 0, 0, 2, 5)
-        self.layout.addWidget(CameraWindow(), 0, 5, 2, 5)
+        self.camera = CameraWindow()
+        self.layout.addWidget(self.camera, 0, 5, 2, 5)
         self.layout.addWidget(self.tabular_window(), 0, 10, 2, 5)
         self.layout.addWidget(self.sample_window(), 2, 0, 1, 15)
         self.layout.addWidget(self.objective_window(), 3, 0, 1, 15)
         self.layout.addWidget(self.base_window(), 4, 0, 3, 15)
 
+        # Only accept decimal numbers in the numeric line edits.
+        validator = QDoubleValidator(self)
+        locale = QLocale.c()
+        locale.setNumberOptions(QLocale.RejectGroupSeparator)
+        validator.setLocale(locale)
+        lineEdits = [self.tab.TMTM, self.tab.TMRM, self.tab.TMVM,
+                     self.tab.TMBM]
+        for object in ["S", "O"]:
+            for axis in ["x", "y", "z"]:
+                lineEdits += [self.__dict__[f"{axis}{object}Step"],
+                              self.__dict__[f"{axis}{object}AbsPos"],
+                              self.tab.__dict__[f"{axis}{object}Min"],
+                              self.tab.__dict__[f"{axis}{object}Max"],
+                              self.tab.__dict__[f"{axis}{object}B"]]
+        for lineEdit in lineEdits:
+            lineEdit.setValidator(validator)
+
         # Set main window layout.
         self.centralWidget = QWidget(self)
         self.setCentralWidget(self.centralWidget)
@@ -714,12 +737,18 @@ class CameraWindow(QMainWindow):
         QWidget window containing camera feed and interface.
     img : pg.ImageItem
         Live feed image from Blackfly camera.
+    frame : nd.array
+        Current camera frame in the camera's orientation.
     image : nd.array
-        Current image displayed in an array representation.
+        Current image displayed in an array representation (a rotated view of
+        `frame`).
     WCB : QPushButton
         Image capture push button.
     SHC : QPushButton
         Show Cross Hairs toggle push button.
+    saveFailed : pyqtSignal
+        Signal emitted with an error message when an image capture could not
+        be saved.
 
     Methods
     -------
@@ -729,6 +758,8 @@ class CameraWindow(QMainWindow):
         Live stream image capture.
     """
 
+    saveFailed = pyqtSignal(str)
+
     def __init__(self):
         """Initialize camera window.
         
@@ -759,26 +790,32 @@ class CameraWindow(QMainWindow):
         Notes
         -----
         This method creates the live feed by repeatedly calling for an image
-        from the camera. It takes the received Numpy array and displays it on
-        a matplotlib plot. This is a very poor way of displaying a video and
-        should be looked into improving as it may significantly reduce the
-        latency of the program.
+        from the camera every 75 ms. The received Numpy array is displayed in
+        a pyqtgraph `ImageItem` within a `GraphicsLayoutWidget`.
         """
 
         def updateData() -> None:
             """Update live feed display.
 
             This method updates the live feed display by calling for a new
-            image and plotting the returned Numpy array on a matplotlib plot.
+            image and setting the returned Numpy array on the pyqtgraph image
+            item.
 
             Notes
             -----
             The red cross hair is added by changing the central five rows and
             columns of pixels in the image to red (RGB=[225, 0, 0]).
+
+            The camera frame is required to be a C-contiguous, writable array
+            owning its memory, which only copies it if the camera returns a
+            read-only array or a view of a driver buffer. The image is kept as
+            a rotated view of that frame so that the cross hairs can be drawn
+            in place and rotating it back for saving does not require a copy.
             """
 
             # Get new image.
-            self.image = np.copy(np.rot90(get_image()))
+            self.frame = np.require(get_image(), requirements=["C", "W", "O"])
+            self.image = np.rot90(self.frame)
             height = self.image.shape[0]
             width = self.image.shape[1]
 
@@ -843,9 +880,13 @@ class CameraWindow(QMainWindow):
 
         Notes
         -----
-        The image will be saved as the Numpy array shown on the matplotlib
-        plot. Thus, if the cross hairs button is turned on, the cross hairs
-        will also be saved in the image.
+        The image will be saved as the Numpy array shown on the live feed.
+        Thus, if the cross hairs button is turned on, the cross hairs will
+        also be saved in the image.
+
+        The array is encoded as a JPEG with Pillow by a `SaveImageWorker` on
+        the global thread pool so that the live feed is not blocked while the
+        file is written.
         """
 
         params = {"parent": self,
@@ -854,10 +895,83 @@ class CameraWindow(QMainWindow):
                   "filter": "Image files (*.jpg *.jpeg)"}
         path, _ = QFileDialog.getSaveFileName(**params)
 
-        plt.figure()
-        plt.imshow(np.rot90(self.image, 3))
-        plt.axis("off")
-        plt.savefig(path, dpi=500, bbox_inches="tight")
+        # Exit the method if the dialog was cancelled.
+        if not path:
+            return None
+
+        # Default to the JPEG extension if none was given.
+        if not os.path.splitext(path)[1]:
+            path += ".jpg"
+
+        # Each frame owns its memory and is not modified once displayed, so
+        # rotating back to it hands the worker the frame without a copy.
+        image = np.ascontiguousarray(np.rot90(self.image, 3))
+        worker = SaveImageWorker(image, path)
+        worker.signals.failed.connect(self.saveFailed)
+        QThreadPool.globalInstance().start(worker)
+
+
+class SaveImageSignals(QObject):
+    """Signals of the background image writer.
+
+    Attributes
+    ----------
+    failed : pyqtSignal
+        Signal emitted with an error message when the image could not be
+        saved.
+    """
+
+    failed = pyqtSignal(str)
+
+
+class SaveImageWorker(QRunnable):
+    """Background image writer.
+
+    Parameters
+    ----------
+    image : nd.array
+        Image to save.
+    path : str
+        File path to save the image to.
+
+    Attributes
+    ----------
+    image : nd.array
+        Image to save.
+    path : str
+        File path to save the image to.
+    signals : SaveImageSignals
+        Signals reporting the outcome to the GUI thread.
+
+    Methods
+    -------
+    run()
+        Save the image.
+    """
+
+    def __init__(self, image: np.ndarray, path: str) -> None:
+        """Initialize the worker."""
+
+        super().__init__()
+        self.image = image
+        self.path = path
+        self.signals = SaveImageSignals()
+
+    def run(self) -> None:
+        """Save the image.
+
+        Notes
+        -----
+        Any error is reported through `signals` rather than raised, as an
+        exception escaping a thread pool worker would abort the program
+        without stopping the motors.
+        """
+
+        try:
+            Image.fromarray(self.image).save(self.path, format="JPEG",
+                                             quality=95)
+        except Exception as error:
+            self.signals.failed.emit(f"ERROR: Image not saved: {error}")
 
 
 class MyTableWidget(QWidget):